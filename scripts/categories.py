@@ -3,7 +3,13 @@ Category normalization and mapping for the GSAU.gg scraper.
 Maps raw product categories to standardized categories.
 """
 
+import os
 import re
+import sys
+from bisect import bisect_right
+from functools import lru_cache
+
+import ahocorasick
 
 # Category normalization - map messy categories to clean ones
 CATEGORY_MAP = {
@@ -297,13 +303,14 @@ CATEGORY_MAP = {
     "tactical belt": "Tactical Gear",
     "knee pad": "Tactical Gear",
     "elbow pad": "Tactical Gear",
-    # HTML encoded categories
-    "magazines &amp; drums": "Magazines",
-    "east crane (e&amp;c)": "Parts",
-    "bearing &amp; gears": "Internals",
-    "rifles &amp; other blasters": "Blasters",
-    "imperial custom &amp; precision": "Parts",
-    "catelory a &amp; b an storage": "Holsters & Bags",
+    # Stores that send these HTML-encoded ("... &amp; ...") are handled by
+    # entity decoding in the lookup path, so only the decoded form is listed
+    "magazines & drums": "Magazines",
+    "east crane (e&c)": "Parts",
+    "bearing & gears": "Internals",
+    "rifles & other blasters": "Blasters",
+    "imperial custom & precision": "Parts",
+    "catelory a & b an storage": "Holsters & Bags",
     "'hpa air fitting accessories": "HPA Parts",
     # Typos
     "accessoires": "Accessories",
@@ -496,6 +503,17 @@ CATEGORY_MAP = {
 }
 
 # Title-based categorization patterns (order matters - first match wins)
+# Shared fragments for the title patterns below. _both(a, b) spells out the
+# "contains a and b in either order" idiom the table has always used; kept as
+# A.*B|B.*A rather than lookaheads, which re evaluates slower when backtracking.
+_GEL_BLASTERS = r"\bgel blasters?\b"
+
+
+def _both(a: str, b: str) -> str:
+    """Pattern matching titles that contain both fragments, in either order."""
+    return rf"{a}.*{b}|{b}.*{a}"
+
+
 TITLE_CATEGORY_PATTERNS = [
     # ========== PARTS DETECTION (must come FIRST to take precedence) ==========
 
@@ -533,7 +551,7 @@ TITLE_CATEGORY_PATTERNS = [
 
     # Spring parts
     (r"\b(spring guide|spring retainer|spring set|spring kit|spring pack)\b", "Springs"),
-    (r"\b(un-?equal|non-?linear)\b.*\bspring\b|\bspring\b.*\b(un-?equal|non-?linear)\b", "Springs"),
+    (_both(r"\b(un-?equal|non-?linear)\b", r"\bspring\b"), "Springs"),
     (r"\bm\d{2,3}\s*spring\b|\bm\d{2,3}\b.*\b(aeg|gel blaster)\b.*\bspring\b", "Springs"),
     (r"\b(v2|v3)\s*spring\b|\bspring\s*(v2|v3)\b", "Springs"),
 
@@ -568,12 +586,12 @@ TITLE_CATEGORY_PATTERNS = [
     (r"\bgrip\b(?!.*\b(gel blaster|blaster|rifle|pistol|smg|shotgun)\b)", "Grips"),  # grip but not "grip gel blaster"
 
     # Parts with "gel blaster(s)" in title (must come before "gel blaster" fallback)
-    (r"\bgel blasters?\b.*\b(cutoff|cut-?off)\s*switch\b|\b(cutoff|cut-?off)\s*switch\b.*\bgel blasters?\b", "Gearboxes"),
-    (r"\bgel blasters?\b.*\bgears?\b|\bgears?\b.*\bgel blasters?\b", "Gearboxes"),
-    (r"\bgel blasters?\b.*\bgear\s*box\b|\bgear\s*box\b.*\bgel blasters?\b", "Gearboxes"),
-    (r"\bgel blasters?\b.*\bvalve\b|\bvalve\b.*\bgel blasters?\b", "Pistol Parts"),
+    (_both(_GEL_BLASTERS, r"\b(cutoff|cut-?off)\s*switch\b"), "Gearboxes"),
+    (_both(_GEL_BLASTERS, r"\bgears?\b"), "Gearboxes"),
+    (_both(_GEL_BLASTERS, r"\bgear\s*box\b"), "Gearboxes"),
+    (_both(_GEL_BLASTERS, r"\bvalve\b"), "Pistol Parts"),
     (r"\bgel blasters?\b.*\bgrip\b|\bgrip\b.*\bgel blasters?\b(?!.*\b(rifle|pistol|smg)\b)", "Grips"),
-    (r"\bgel blasters?\b.*\bmagazines?\b|\bmagazines?\b.*\bgel blasters?\b", "Magazines"),
+    (_both(_GEL_BLASTERS, r"\bmagazines?\b"), "Magazines"),
 
     # More motor patterns
     (r"\b(v2|v3)\s*motor\b|\bmotor\s*(v2|v3|short|long)\b", "Motors"),
@@ -595,7 +613,7 @@ TITLE_CATEGORY_PATTERNS = [
     (r"\b(smoke\s*)?grenade\b.*\bspring\b|\bspring\b.*\bgrenade\b", "Grenades"),
 
     # More specific parts with "gel blaster(s)" in title
-    (r"\bgel blasters?\b.*\b(o-?ring|mag part)\b|\b(o-?ring|mag part)\b.*\bgel blasters?\b", "Internals"),
+    (_both(_GEL_BLASTERS, r"\b(o-?ring|mag part)\b"), "Internals"),
     (r"\bmag\s*release\b|\bmag\s*well\b", "Parts"),
     (r"\b(prometheus|laylax)\b.*\b(gear|spring|hop)\b", "Parts"),
     (r"\bhard\s*gear\b|\bgear\s*(set|high speed)\b", "Gearboxes"),
@@ -603,12 +621,12 @@ TITLE_CATEGORY_PATTERNS = [
     # ========== BLASTER PATTERNS (come after parts detection) ==========
 
     # Blasters - be specific to avoid false positives
-    (r"\bgel blasters?\b.*\brifle\b|\brifle\b.*\bgel blasters?\b", "Rifles"),
-    (r"\bgel blasters?\b.*\bpistol\b|\bpistol\b.*\bgel blasters?\b", "Pistols"),
-    (r"\bgel blasters?\b.*\bsmg\b|\bsmg\b.*\bgel blasters?\b", "SMGs"),
-    (r"\bgel blasters?\b.*\bshotgun\b|\bshotgun\b.*\bgel blasters?\b", "Shotguns"),
+    (_both(_GEL_BLASTERS, r"\brifle\b"), "Rifles"),
+    (_both(_GEL_BLASTERS, r"\bpistol\b"), "Pistols"),
+    (_both(_GEL_BLASTERS, r"\bsmg\b"), "SMGs"),
+    (_both(_GEL_BLASTERS, r"\bshotgun\b"), "Shotguns"),
     (r"\bshotgun blaster\b|\brepeater shotgun\b", "Shotguns"),
-    (r"\bgel blasters?\b.*\bsniper\b|\bsniper\b.*\bgel blasters?\b", "Snipers"),
+    (_both(_GEL_BLASTERS, r"\bsniper\b"), "Snipers"),
     (r"\b(m4a1|m4|ar15|ar-15|hk416|scar|ak47|ak-47|g36|acr|mcx)\b.*(gel blasters?|blasters?)", "Rifles"),
     (r"\b(glock|1911|hi-?capa|hicapa|ppk|desert eagle|m9|m92|p226|sig|beretta)\b.*(gel blasters?|blasters?|pistol)", "Pistols"),
     (r"\b(mp5|mp7|ump|vector|p90|mac-?10|uzi)\b.*(gel blasters?|blasters?)", "SMGs"),
@@ -972,45 +990,213 @@ TAG_CATEGORY_MAP = {
 }
 
 
-def normalize_category(category: str) -> tuple[str, bool]:
+# Rebuild the maps once at import: keys stripped/lowercased so lookups never
+# have to wonder whether the table is normalized, and every key and category
+# name interned so each appears as a single shared object and the sentinel
+# can be compared by identity in the hot paths
+CATEGORY_MAP = {sys.intern(k.strip().lower()): sys.intern(v) for k, v in CATEGORY_MAP.items()}
+TAG_CATEGORY_MAP = {sys.intern(k.strip().lower()): sys.intern(v) for k, v in TAG_CATEGORY_MAP.items()}
+TITLE_CATEGORY_PATTERNS = [(p, sys.intern(c)) for p, c in TITLE_CATEGORY_PATTERNS]
+_UNCATEGORIZED = sys.intern("Uncategorized")
+
+# Partition CATEGORY_MAP for the hot path: suppressed entries ("") become a
+# frozenset membership test instead of a fetch-and-compare against the empty
+# string, and the productive map no longer carries ~100 empty values
+_SUPPRESSED_CATEGORY_KEYS = frozenset(k for k, v in CATEGORY_MAP.items() if v == "")
+_PRODUCTIVE_CATEGORY_MAP = {k: v for k, v in CATEGORY_MAP.items() if v}
+
+# Bind dict lookups once so the hot functions use a local fast method
+# instead of re-resolving the attribute on every call
+_CATEGORY_GET = _PRODUCTIVE_CATEGORY_MAP.get
+_TAG_GET = TAG_CATEGORY_MAP.get
+
+# Nearly every product tag misses the map; the `in` operator on a frozenset
+# rejects those without the call overhead of dict.get per tag
+_TAG_KEYS = frozenset(TAG_CATEGORY_MAP)
+
+# Compile title patterns once at import time. Kept as a parallel structure so
+# TITLE_CATEGORY_PATTERNS above stays readable/editable as plain strings.
+# Order is preserved - first match wins.
+#
+# Patterns that only match word-bounded literal phrases - a single phrase
+# (r"\bfoo bar\b"), a literal group (r"\b(foo|bar baz)\b"), or a top-level
+# alternation of bounded phrases - are pulled out into an Aho-Corasick
+# automaton so one scan of the title covers all of them; the rest stay as
+# compiled regexes, each keeping its original priority index so
+# first-match-wins ordering is preserved exactly.
+_LITERAL_PATTERN_RE = re.compile(r"\A\\b([a-z0-9 '&-]+)\\b\Z")
+_LITERAL_GROUP_RE = re.compile(r"\A\\b\(([a-z0-9 '&|-]+)\)\\b\Z")
+
+
+def _pattern_literals(pattern: str) -> list | None:
+    """Return the literal phrases a pattern matches, or None if it's a real regex."""
+    match = _LITERAL_GROUP_RE.match(pattern)
+    if match:
+        literals = match.group(1).split("|")
+    else:
+        literals = []
+        for part in pattern.split("|"):
+            part_match = _LITERAL_PATTERN_RE.match(part)
+            if part_match is None:
+                return None
+            literals.append(part_match.group(1))
+    # Word-boundary verification at query time assumes each phrase starts and
+    # ends on a word character
+    if all(lit[0].isalnum() and lit[-1].isalnum() for lit in literals):
+        return literals
+    return None
+
+
+def _split_title_patterns(patterns):
+    """Split patterns into an AC automaton of literals plus residual regexes."""
+    automaton = ahocorasick.Automaton()
+    residual = []
+    seen = set()
+    for index, (pattern, category) in enumerate(patterns):
+        # An exact duplicate of an earlier pattern can never decide (the first
+        # occurrence outranks it on identical input), so don't scan it twice
+        if pattern in seen:
+            continue
+        seen.add(pattern)
+        literals = _pattern_literals(pattern)
+        if literals is not None:
+            for literal in literals:
+                existing = automaton.get(literal, None)
+                if existing is None or index < existing[0]:
+                    automaton.add_word(literal, (index, len(literal), category))
+            continue
+        residual.append((index, re.compile(pattern), category))
+    automaton.make_automaton()
+    # Tuple, not list: the table is never mutated after import and iterating
+    # a tuple is marginally cheaper in the per-title loop
+    return automaton, tuple(residual)
+
+
+# Structure-of-arrays layout: the scan loop touches only the patterns tuple,
+# and the parallel index/category tuples are consulted on break or match.
+# Indexes are ascending, which lets the loop bound be found by bisection.
+_TITLE_AUTOMATON, _residual = _split_title_patterns(TITLE_CATEGORY_PATTERNS)
+_RESIDUAL_INDEXES, _RESIDUAL_PATTERNS, _RESIDUAL_CATEGORIES = map(tuple, zip(*_residual))
+del _residual
+
+# Opt-in instrumentation (GSAU_PROFILE_PATTERNS=1): count which title pattern
+# decides each unique title and dump the ranking at exit, so pattern order can
+# be tuned by hand. Automatic reordering is deliberately not done - list order
+# encodes priority (parts before blasters), so a hot pattern may only move
+# within the span where it does not cross one it is meant to pre-empt.
+_PATTERN_HITS = None
+if os.environ.get("GSAU_PROFILE_PATTERNS"):
+    import atexit
+    from collections import Counter
+
+    _PATTERN_HITS = Counter()
+
+    def _dump_pattern_hits():
+        for index, hits in _PATTERN_HITS.most_common():
+            print(f"{hits:6d}  [{index:3d}] {TITLE_CATEGORY_PATTERNS[index][0]}", file=sys.stderr)
+
+    atexit.register(_dump_pattern_hits)
+
+
+def _is_word_char(ch: str) -> bool:
+    """Approximate re's \\w for the word-boundary check around AC hits."""
+    return ch.isalnum() or ch == "_"
+
+
+def normalize_category(category: str) -> tuple[str, bool, bool]:
     """
     Normalize a category name to a standard form.
 
     Returns:
-        (category, was_suppressed): category name and whether it was explicitly suppressed
+        (category, was_suppressed, was_mapped): the category name, whether it
+        was explicitly suppressed, and whether CATEGORY_MAP actually hit -
+        so callers can tell a mapping from the title-cased fallback without
+        recomputing .title() to compare
     """
     if not category:
-        return "Uncategorized", False
+        return _UNCATEGORIZED, False, False
 
-    cat_lower = category.lower().strip()
-    mapped = CATEGORY_MAP.get(cat_lower)
+    # Decode the one HTML entity stores actually send; CPython's str.replace
+    # returns the original string untouched when there is no occurrence
+    cat_lower = category.lower().strip().replace("&amp;", "&")
 
-    # Empty string means "skip this category, use title-based"
-    if mapped == "":
-        return "Uncategorized", True
+    # Suppressed means "skip this category, use title-based"
+    if cat_lower in _SUPPRESSED_CATEGORY_KEYS:
+        return _UNCATEGORIZED, True, True
 
-    return (mapped if mapped else category.title()), False
+    mapped = _CATEGORY_GET(cat_lower)
+    if mapped:
+        return mapped, False, True
+    return category.title(), False, False
 
 
 def categorize_by_title(title: str) -> str:
     """Try to categorize based on product title patterns."""
-    title_lower = title.lower()
-    for pattern, category in TITLE_CATEGORY_PATTERNS:
-        if re.search(pattern, title_lower):
-            return category
-    return "Uncategorized"
+    return _categorize_title_lower(title.lower()) or _UNCATEGORIZED
+
+
+@lru_cache(maxsize=16384)
+def _categorize_title_lower(title_lower: str) -> str | None:
+    """Categorize an already-lowercased title, or None if nothing matched (hot path)."""
+    # One Aho-Corasick pass finds every literal-pattern hit; keep the one with
+    # the highest priority (lowest index in TITLE_CATEGORY_PATTERNS).
+    best_index = None
+    best_category = None
+    last = len(title_lower) - 1
+    for end, (index, length, category) in _TITLE_AUTOMATON.iter(title_lower):
+        if best_index is not None and index >= best_index:
+            continue
+        start = end - length + 1
+        if start > 0 and _is_word_char(title_lower[start - 1]):
+            continue
+        if end < last and _is_word_char(title_lower[end + 1]):
+            continue
+        best_index = index
+        best_category = category
+
+    # Walk the remaining regexes in priority order; once past the best literal
+    # hit's index, the literal wins and nothing later can beat it, so the
+    # loop bound is found up front instead of re-checking every iteration
+    if best_index is None:
+        stop = len(_RESIDUAL_PATTERNS)
+    else:
+        stop = bisect_right(_RESIDUAL_INDEXES, best_index)
+    for position in range(stop):
+        if _RESIDUAL_PATTERNS[position].search(title_lower):
+            if _PATTERN_HITS is not None:
+                _PATTERN_HITS[_RESIDUAL_INDEXES[position]] += 1
+            return _RESIDUAL_CATEGORIES[position]
+    if best_category is not None:
+        if _PATTERN_HITS is not None:
+            _PATTERN_HITS[best_index] += 1
+        return best_category
+    return None
+
+
+def ingest_tags(tags: list) -> tuple:
+    """
+    Normalize tags once at ingestion: lowercased, stripped, as a hashable tuple.
+
+    Passing the result to get_best_category skips re-normalization (lower/strip
+    is idempotent) and gives case-variant tags the same cache slot.
+    """
+    return tuple(t.lower().strip() for t in tags)
 
 
 def categorize_by_tags(tags: list) -> str:
     """Try to categorize based on product tags."""
-    for tag in tags:
-        tag_lower = tag.lower().strip()
-        if tag_lower in TAG_CATEGORY_MAP:
-            return TAG_CATEGORY_MAP[tag_lower]
-    return "Uncategorized"
+    return _categorize_tags_lower([t.lower().strip() for t in tags]) or _UNCATEGORIZED
+
+
+def _categorize_tags_lower(tags_lower: list) -> str | None:
+    """Categorize from already-lowercased, stripped tags, or None if none mapped (hot path)."""
+    for tag in tags_lower:
+        if tag in _TAG_KEYS:
+            return _TAG_GET(tag)
+    return None
 
 
-def get_best_category(raw_category: str, title: str, tags: list = None) -> str:
+def get_best_category(raw_category: str, title: str, tags: list | tuple = ()) -> str:
     """
     Determine the best category for a product using multiple strategies.
 
@@ -1020,27 +1206,35 @@ def get_best_category(raw_category: str, title: str, tags: list = None) -> str:
     3. Direct category mapping - store categories (often too broad)
     4. Fallback to original category or "Uncategorized"
     """
-    if tags is None:
-        tags = []
+    # Same product appears across scrape runs and history passes; cache on a
+    # hashable key (tags as a tuple) so repeats skip the pattern matching.
+    return _get_best_category_cached(raw_category, title, tuple(tags) if tags else ())
 
+
+@lru_cache(maxsize=16384)
+def _get_best_category_cached(raw_category: str, title: str, tags: tuple) -> str:
     # Try title-based categorization first (most specific)
-    title_category = categorize_by_title(title)
-    if title_category != "Uncategorized":
+    title_category = _categorize_title_lower(title.lower())
+    if title_category is not None:
         return title_category
 
-    # Try tag-based categorization
-    tag_category = categorize_by_tags(tags)
-    if tag_category != "Uncategorized":
-        return tag_category
+    # Try tag-based categorization; most products carry no tags at all, so
+    # don't normalize an empty list for nothing
+    if tags:
+        tag_category = _categorize_tags_lower([t.lower().strip() for t in tags])
+        if tag_category is not None:
+            return tag_category
 
     # Try direct category mapping (store categories)
-    category, was_suppressed = normalize_category(raw_category)
-    if category != "Uncategorized" and category != raw_category.title():
-        return category
-
-    # If category was explicitly suppressed, stay Uncategorized
-    if was_suppressed:
-        return "Uncategorized"
-
-    # Return the normalized original category or Uncategorized
-    return category if category != "Uncategorized" else raw_category.title() if raw_category else "Uncategorized"
+    if not raw_category:
+        return _UNCATEGORIZED
+    cat_lower = raw_category.lower().strip().replace("&amp;", "&")
+    # Suppressed categories are explicitly forced to Uncategorized
+    if cat_lower in _SUPPRESSED_CATEGORY_KEYS:
+        return _UNCATEGORIZED
+    mapped = _CATEGORY_GET(cat_lower)
+    if mapped:
+        return mapped
+
+    # Unmapped - fall back to the title-cased original category
+    return raw_category.title()
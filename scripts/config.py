@@ -23,6 +23,7 @@ REQUEST_RETRIES = 5  # retry failed requests this many times
 RETRY_DELAY = 5  # seconds to wait before retry
 MAX_PAGES = 40  # max pages per store (safety limit)
 MAX_WORKERS = 5  # parallel store fetches (don't set too high)
+VARIATION_WORKERS = 3  # parallel WooCommerce variation pages (keep polite per store)
 FUTURE_TIMEOUT = 300  # seconds to wait for each store fetch (5 min)
 
 # Data quality
@@ -19,8 +19,14 @@ logger = logging.getLogger(__name__)
 class StoreLoggerAdapter(logging.LoggerAdapter):
     """Logger adapter that prefixes messages with store name."""
 
+    def __init__(self, logger, extra):
+        super().__init__(logger, extra)
+        # The prefix never changes; build it once instead of formatting the
+        # extra dict into an f-string on every log call
+        self._prefix = f"{extra['store']}: "
+
     def process(self, msg, kwargs):
-        return f"{self.extra['store']}: {msg}", kwargs
+        return self._prefix + msg, kwargs
 
 
 class BaseFetcher(ABC):
@@ -34,6 +40,13 @@ class BaseFetcher(ABC):
     - _parse_products(products): Parse/filter products (optional override)
     """
 
+    # Slotted (subclasses declare their own slots too): a scrape spawns one
+    # fetcher per store in parallel and never sets ad-hoc attributes
+    __slots__ = (
+        "store_name", "base_url", "products", "error", "start_time",
+        "duration", "total_fetched", "total_filtered", "log", "session",
+    )
+
     def __init__(self, store_name: str, base_url: str):
         self.store_name = store_name
         self.base_url = base_url.rstrip('/')
@@ -45,15 +58,25 @@ class BaseFetcher(ABC):
         self.total_filtered = 0
         # Logger with store name prefix
         self.log = StoreLoggerAdapter(logger, {'store': store_name})
+        # One session per fetcher: keep-alive reuses the TCP/TLS connection
+        # across the store's pages instead of a fresh handshake per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
 
     @property
     def headers(self) -> dict:
         """Default headers for requests."""
-        return {"User-Agent": USER_AGENT}
+        return {
+            "User-Agent": USER_AGENT,
+            # Catalog JSON compresses ~5-10x; stated explicitly so a subclass
+            # overriding headers doesn't silently drop compression. (brotli
+            # would need an extra dependency for requests to decode it.)
+            "Accept-Encoding": "gzip, deflate",
+        }
 
     def _make_request(self, url: str, timeout: int = REQUEST_TIMEOUT) -> requests.Response:
         """Make an HTTP request with standard error handling."""
-        return requests.get(url, timeout=timeout, headers=self.headers)
+        return self.session.get(url, timeout=timeout)
 
     def _delay(self) -> None:
         """Delay between requests to be respectful."""
@@ -14,6 +14,8 @@ from fetchers.base import BaseFetcher
 class ShopifyFetcher(BaseFetcher):
     """Fetcher for Shopify stores using the /products.json endpoint."""
 
+    __slots__ = ()
+
     @property
     def platform_name(self) -> str:
         return "shopify"
@@ -13,6 +13,8 @@ from fetchers.base import BaseFetcher
 class SquarespaceFetcher(BaseFetcher):
     """Fetcher for Squarespace stores using the /store?format=json endpoint."""
 
+    __slots__ = ("page_size", "offset")
+
     def __init__(self, store_name: str, base_url: str):
         super().__init__(store_name, base_url)
         self.page_size = 20
@@ -39,8 +41,8 @@ class SquarespaceFetcher(BaseFetcher):
         """
         Extract JSON from Squarespace response.
 
-        Squarespace may include extra content after JSON, so we need to
-        find the actual JSON boundary by counting braces.
+        Squarespace may include extra content after the JSON document, so
+        parse a prefix and ignore whatever trails it.
         """
         # First try normal JSON parsing
         try:
@@ -48,24 +50,17 @@ class SquarespaceFetcher(BaseFetcher):
         except json.JSONDecodeError:
             pass
 
-        # Fall back to brace-counting for malformed responses
-        brace_count = 0
-        end_index = 0
-
-        for i, char in enumerate(text):
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-            if brace_count == 0 and i > 0:
-                end_index = i + 1
-                break
-
-        if end_index > 0:
-            return json.loads(text[:end_index])
-
-        # Last resort: raise error
-        raise json.JSONDecodeError("Could not find valid JSON", text, 0)
+        # Fall back to parsing just the leading JSON document. raw_decode
+        # stops at the end of the first value (via the C scanner, and unlike
+        # brace counting it understands braces inside strings) and ignores
+        # trailing content. Unlike json.loads it doesn't skip leading
+        # whitespace itself, so start it past any.
+        try:
+            start = len(text) - len(text.lstrip())
+            obj, _ = json.JSONDecoder().raw_decode(text, start)
+            return obj
+        except json.JSONDecodeError:
+            raise json.JSONDecodeError("Could not find valid JSON", text, 0) from None
 
     def _log_page_progress(self, page: int, count: int) -> None:
         """Log with offset instead of page number."""
@@ -5,12 +5,17 @@ Handles both simple products and variable products with variations.
 """
 
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import requests
 
 from fetchers.base import BaseFetcher
-from config import REQUEST_DELAY
+from config import REQUEST_DELAY, VARIATION_WORKERS
+
+# API paths already detected this run, keyed by store base URL. Saves the
+# probe requests when a store is fetched more than once in a process.
+_API_PATH_CACHE: dict[str, str] = {}
 
 
 class WooCommerceFetcher(BaseFetcher):
@@ -24,9 +29,16 @@ class WooCommerceFetcher(BaseFetcher):
     5. Return simple products + enriched variations
     """
 
+    __slots__ = (
+        "api_path", "_page_url_prefix", "_variation_url_prefix",
+        "per_page", "fetch_variations",
+    )
+
     def __init__(self, store_name: str, base_url: str):
         super().__init__(store_name, base_url)
         self.api_path = None  # Detected in _setup()
+        self._page_url_prefix = None  # Built in _setup() once api_path is known
+        self._variation_url_prefix = None
         self.per_page = 100
         self.fetch_variations = True  # Can be disabled for testing
 
@@ -36,7 +48,16 @@ class WooCommerceFetcher(BaseFetcher):
 
     def _setup(self) -> None:
         """Detect the correct WooCommerce API path before fetching."""
-        self.api_path = self._detect_api_path()
+        cached = _API_PATH_CACHE.get(self.base_url)
+        if cached:
+            self.api_path = cached
+        else:
+            self.api_path = self._detect_api_path()
+            _API_PATH_CACHE[self.base_url] = self.api_path
+        # Everything but the page number is fixed for the whole fetch
+        api_base = f"{self.base_url}{self.api_path}"
+        self._page_url_prefix = f"{api_base}?per_page={self.per_page}&page="
+        self._variation_url_prefix = f"{api_base}?type=variation&per_page={self.per_page}&page="
 
     def _detect_api_path(self) -> str:
         """Detect which WooCommerce API path is available."""
@@ -58,7 +79,7 @@ class WooCommerceFetcher(BaseFetcher):
         return "/wp-json/wc/store/v1/products"
 
     def _build_page_url(self, page: int) -> str:
-        return f"{self.base_url}{self.api_path}?per_page={self.per_page}&page={page}"
+        return self._page_url_prefix + str(page)
 
     def _extract_products(self, data: Any) -> list:
         # WooCommerce returns array directly
@@ -79,25 +100,15 @@ class WooCommerceFetcher(BaseFetcher):
         if not self.fetch_variations:
             return products, stats
 
-        # Build parent lookup for variable products
-        parent_lookup = {}
-        simple_products = []
-        variable_count = 0
-
-        for p in products:
-            product_type = p.get("type", "simple")
-            if product_type == "variable":
-                # Save for category lookup
-                parent_lookup[p["id"]] = {
-                    "name": p.get("name", ""),
-                    "categories": p.get("categories", []),
-                    "images": p.get("images", []),
-                    "tags": p.get("tags", []),
-                }
-                variable_count += 1
-            else:
-                # Keep simple products
-                simple_products.append(p)
+        # Split simple from variable products, then build the parent
+        # lookups for the variable ones. Only categories and tags are
+        # inherited by variations, so only those are kept. Comprehensions
+        # keep these passes at C loop speed.
+        variables = [p for p in products if p.get("type", "simple") == "variable"]
+        simple_products = [p for p in products if p.get("type", "simple") != "variable"]
+        parent_categories = {p["id"]: p.get("categories", []) for p in variables}
+        parent_tags = {p["id"]: p.get("tags", []) for p in variables}
+        variable_count = len(variables)
 
         # Fetch variations if there are variable products
         variations = []
@@ -105,19 +116,21 @@ class WooCommerceFetcher(BaseFetcher):
             self.log.info(f"Found {variable_count} variable products, fetching variations...")
             variations = self._fetch_variations()
 
-            # Enrich variations with parent data
+            # Enrich variations with parent data. Skip the loop entirely
+            # when no parent has anything to inherit (some stores
+            # categorize at the variation level only).
             enriched = 0
-            for v in variations:
-                parent_id = v.get("parent")
-                parent = parent_lookup.get(parent_id)
-                if parent:
-                    # Inherit categories from parent
-                    if not v.get("categories"):
-                        v["categories"] = parent["categories"]
-                    # Inherit tags from parent
-                    if not v.get("tags"):
-                        v["tags"] = parent["tags"]
-                    enriched += 1
+            if any(parent_categories.values()) or any(parent_tags.values()):
+                for v in variations:
+                    parent_id = v.get("parent")
+                    categories = parent_categories.get(parent_id)
+                    if categories is not None:
+                        # Inherit categories and tags from parent
+                        if not v.get("categories"):
+                            v["categories"] = categories
+                        if not v.get("tags"):
+                            v["tags"] = parent_tags[parent_id]
+                        enriched += 1
 
             self.log.info(f"Fetched {len(variations)} variations, enriched {enriched}")
 
@@ -136,35 +149,71 @@ class WooCommerceFetcher(BaseFetcher):
 
         return all_products, stats
 
+    def _variation_page_url(self, page: int) -> str:
+        return self._variation_url_prefix + str(page)
+
+    def _fetch_variation_page(self, page: int) -> list | None:
+        """Fetch a single variations page. Returns None on request failure."""
+        try:
+            response = self._make_request(self._variation_page_url(page))
+            response.raise_for_status()
+            data = response.json()
+        except requests.RequestException as e:
+            self.log.error(f"Failed to fetch variations page {page}: {e}")
+            return None
+        except ValueError as e:
+            self.log.error(f"JSON parse error on variations page {page}: {e}")
+            return None
+        return data if isinstance(data, list) else []
+
     def _fetch_variations(self) -> list:
-        """Fetch all variations using ?type=variation query."""
-        variations = []
-        page = 1
+        """Fetch all variations using ?type=variation query.
 
+        Page 1 is fetched first to learn the total page count from the
+        X-WP-TotalPages header WooCommerce sends; the remaining pages are
+        then fetched by a small thread pool over the shared session. Stores
+        that omit the header fall back to the old serial pagination.
+        """
+        try:
+            response = self._make_request(self._variation_page_url(1))
+            response.raise_for_status()
+            data = response.json()
+        except requests.RequestException as e:
+            self.log.error(f"Failed to fetch variations page 1: {e}")
+            return []
+        except ValueError as e:
+            self.log.error(f"JSON parse error on variations page 1: {e}")
+            return []
+
+        if not isinstance(data, list) or not data:
+            return []
+
+        variations = list(data)
+        self.log.info(f"Variations page 1: {len(data)} items")
+        if len(data) < self.per_page:
+            return variations
+
+        total_pages = response.headers.get("X-WP-TotalPages", "")
+        if total_pages.isdigit() and int(total_pages) > 1:
+            pages = range(2, int(total_pages) + 1)
+            with ThreadPoolExecutor(max_workers=VARIATION_WORKERS) as executor:
+                for page, page_data in zip(pages, executor.map(self._fetch_variation_page, pages)):
+                    if page_data:
+                        variations.extend(page_data)
+                        self.log.info(f"Variations page {page}: {len(page_data)} items")
+            return variations
+
+        # Serial fallback when the store doesn't report its page count
+        page = 2
         while True:
-            url = f"{self.base_url}{self.api_path}?type=variation&per_page={self.per_page}&page={page}"
-
-            try:
-                response = self._make_request(url)
-                response.raise_for_status()
-                data = response.json()
-            except requests.RequestException as e:
-                self.log.error(f"Failed to fetch variations page {page}: {e}")
-                break
-            except ValueError as e:
-                self.log.error(f"JSON parse error on variations page {page}: {e}")
-                break
-
-            if not data:
+            time.sleep(REQUEST_DELAY)
+            page_data = self._fetch_variation_page(page)
+            if not page_data:
                 break
-
-            variations.extend(data)
-            self.log.info(f"Variations page {page}: {len(data)} items")
-
-            if len(data) < self.per_page:
+            variations.extend(page_data)
+            self.log.info(f"Variations page {page}: {len(page_data)} items")
+            if len(page_data) < self.per_page:
                 break
-
             page += 1
-            time.sleep(REQUEST_DELAY)
 
         return variations
@@ -292,45 +292,99 @@ EXCLUDED_CATEGORIES = [
 
 
 # Build Aho-Corasick automata for efficient multi-pattern matching
-def _build_automaton(keywords: list[str]) -> ahocorasick.Automaton:
-    """Build an Aho-Corasick automaton from a list of keywords."""
+def _build_automaton(keywords_by_category: dict) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton with (keyword, category) payloads.
+
+    Storing the category alongside each keyword lets the exclusion-match
+    helpers report it straight from the automaton hit, with no reverse dict.
+
+    Keywords listed with a leading or trailing space (e.g. "mtg " and
+    " mtg") are collapsed into one whole-word entry: the padding is
+    stripped and hits are post-checked for alphanumeric neighbours in
+    _first_match instead. That halves those trie states and, unlike the
+    padded pair, also matches at the very start or end of the text.
+    """
     automaton = ahocorasick.Automaton()
-    for keyword in keywords:
-        automaton.add_word(keyword.lower(), keyword)
+    for category_name, keywords in keywords_by_category.items():
+        for keyword in keywords:
+            keyword = keyword.lower()
+            stripped = keyword.strip()
+            whole_word = stripped != keyword
+            automaton.add_word(
+                stripped, (len(stripped), whole_word, (stripped, category_name))
+            )
     automaton.make_automaton()
     return automaton
 
 
-# Build automata at module load (one-time cost)
-_title_automaton = _build_automaton(EXCLUDED_TITLE_KEYWORDS)
-_tag_automaton = _build_automaton(EXCLUDED_TAGS)
-_category_automaton = _build_automaton(EXCLUDED_CATEGORIES)
+def _first_match(automaton: ahocorasick.Automaton, text: str) -> tuple[str, str] | None:
+    """Return the leftmost-longest (keyword, category) hit in text, or None.
+
+    Whole-word keywords only count when the hit isn't flanked by
+    alphanumerics. Overlapping keywords report the most specific one
+    ("walking dead bat", not "walking dead"). All hits are enumerated
+    with iter() and reduced here: iter_long would consume the span of a
+    whole-word hit even when the boundary check rejects it, hiding
+    keywords that overlap that span (e.g. "ossiarch" inside
+    "unossiarch" after "uno" is rejected).
+    """
+    best_key = None
+    best_match = None
+    for end, (length, whole_word, match) in automaton.iter(text):
+        start = end - length + 1
+        if whole_word:
+            if start > 0 and text[start - 1].isalnum():
+                continue
+            if end + 1 < len(text) and text[end + 1].isalnum():
+                continue
+        key = (start, -length)
+        if best_key is None or key < best_key:
+            best_key = key
+            best_match = match
+    return best_match
+
+
+# Exact-tag fast path: most excluded tags equal a keyword outright, so a
+# dict hit answers them without an automaton walk. Substring hits (e.g. a
+# "funko pop exclusive" tag containing "funko") still fall through to the
+# automaton below.
+_EXACT_TAG_MATCHES = {
+    tag.lower(): (tag.lower(), category_name)
+    for category_name, tags in EXCLUDED_TAGS_BY_CATEGORY.items()
+    for tag in tags
+}
+
+# Build automata at module load (one-time cost). Title, tag and category
+# exclusions stay in separate automata on purpose: each scans a different
+# field, and a combined automaton would report keyword hits of the wrong kind.
+_title_automaton = _build_automaton(EXCLUDED_TITLE_KEYWORDS_BY_CATEGORY)
+_tag_automaton = _build_automaton(EXCLUDED_TAGS_BY_CATEGORY)
+_category_automaton = _build_automaton(EXCLUDED_CATEGORIES_BY_CATEGORY)
 
 
-@lru_cache(maxsize=2048)
 def is_excluded_by_title(title: str) -> bool:
     """Check if product title contains excluded keywords.
 
     Uses Aho-Corasick for O(n+m) matching instead of O(n*m).
-    Results are cached for repeated titles.
+    Not cached: titles are ~96% unique within a scrape, so an lru_cache
+    paid its hash-and-insert on nearly every call for almost no hits.
     """
-    title_lower = title.lower()
-    for _ in _title_automaton.iter(title_lower):
-        return True
-    return False
+    return _first_match(_title_automaton, title.lower()) is not None
 
 
 def is_excluded_by_tags(tags: tuple) -> bool:
     """Check if product tags indicate it should be excluded.
 
-    Uses Aho-Corasick for efficient pattern matching.
+    Tags that equal a keyword outright are answered by a dict lookup;
+    substring matches fall back to one Aho-Corasick pass over all tags.
     Expects a tuple of tags for cache hashability.
     """
-    for tag in tags:
-        tag_lower = tag.lower().strip()
-        for _ in _tag_automaton.iter(tag_lower):
-            return True
-    return False
+    lowered = [tag.lower().strip() for tag in tags]
+    if any(tag in _EXACT_TAG_MATCHES for tag in lowered):
+        return True
+    # NUL never appears in a keyword, so no match can span two tags, and
+    # it also acts as a word boundary for the whole-word post-check.
+    return _first_match(_tag_automaton, "\x00".join(lowered)) is not None
 
 
 @lru_cache(maxsize=1024)
@@ -338,29 +392,12 @@ def is_excluded_by_category(category: str) -> bool:
     """Check if product category indicates it should be excluded.
 
     Uses Aho-Corasick for O(n+m) matching.
-    Results are cached for repeated categories.
+    Results are cached: stores reuse a few dozen categories across the
+    whole catalog, so nearly every call is a cache hit.
     """
     if not category:
         return False
-    cat_lower = category.lower()
-    for _ in _category_automaton.iter(cat_lower):
-        return True
-    return False
-
-
-# Reverse lookup: keyword -> category name
-def _build_keyword_to_category_map(keywords_by_category: dict) -> dict:
-    """Build a reverse lookup from keyword to its category name."""
-    result = {}
-    for category_name, keywords in keywords_by_category.items():
-        for keyword in keywords:
-            result[keyword.lower()] = category_name
-    return result
-
-
-_title_keyword_to_category = _build_keyword_to_category_map(EXCLUDED_TITLE_KEYWORDS_BY_CATEGORY)
-_tag_keyword_to_category = _build_keyword_to_category_map(EXCLUDED_TAGS_BY_CATEGORY)
-_category_keyword_to_category = _build_keyword_to_category_map(EXCLUDED_CATEGORIES_BY_CATEGORY)
+    return _first_match(_category_automaton, category.lower()) is not None
 
 
 def get_title_exclusion_match(title: str) -> tuple[str, str] | None:
@@ -368,11 +405,7 @@ def get_title_exclusion_match(title: str) -> tuple[str, str] | None:
 
     Returns (keyword, category) or None if not excluded.
     """
-    title_lower = title.lower()
-    for _, keyword in _title_automaton.iter(title_lower):
-        category = _title_keyword_to_category.get(keyword.lower(), "unknown")
-        return (keyword, category)
-    return None
+    return _first_match(_title_automaton, title.lower())
 
 
 def get_tag_exclusion_match(tags: tuple) -> tuple[str, str] | None:
@@ -380,12 +413,12 @@ def get_tag_exclusion_match(tags: tuple) -> tuple[str, str] | None:
 
     Returns (keyword, category) or None if not excluded.
     """
-    for tag in tags:
-        tag_lower = tag.lower().strip()
-        for _, keyword in _tag_automaton.iter(tag_lower):
-            category = _tag_keyword_to_category.get(keyword.lower(), "unknown")
-            return (keyword, category)
-    return None
+    lowered = [tag.lower().strip() for tag in tags]
+    for tag in lowered:
+        match = _EXACT_TAG_MATCHES.get(tag)
+        if match is not None:
+            return match
+    return _first_match(_tag_automaton, "\x00".join(lowered))
 
 
 def get_category_exclusion_match(category: str) -> tuple[str, str] | None:
@@ -395,8 +428,4 @@ def get_category_exclusion_match(category: str) -> tuple[str, str] | None:
     """
     if not category:
         return None
-    cat_lower = category.lower()
-    for _, keyword in _category_automaton.iter(cat_lower):
-        filter_category = _category_keyword_to_category.get(keyword.lower(), "unknown")
-        return (keyword, filter_category)
-    return None
+    return _first_match(_category_automaton, category.lower())
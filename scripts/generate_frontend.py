@@ -10,6 +10,8 @@ handles the conversion from our internal normalized structure.
 
 import json
 import logging
+from itertools import groupby
+from operator import itemgetter
 
 from config import STORES_FILE, PROJECT_ROOT, MAX_TAGS
 
@@ -30,13 +32,25 @@ def load_store_names() -> dict[str, str]:
     return {s["id"]: s["name"] for s in data.get("stores", []) if "id" in s}
 
 
-def generate_product(match: dict, items: dict, store_names: dict) -> dict | None:
+def _resolve_item_stores(items: dict, store_names: dict) -> dict:
+    """Resolve each item's store name once, keyed by item id.
+
+    The per-match loops look store names up repeatedly; doing the
+    two-step storeId -> name resolution here leaves them one dict hit.
+    """
+    return {
+        item_id: store_names.get(item.get("storeId"), item.get("storeId"))
+        for item_id, item in items.items()
+    }
+
+
+def generate_product(match: dict, items: dict, item_stores: dict) -> dict | None:
     """Generate a single product entry from a match group.
 
     Args:
         match: Match group with 'id', 'matchedBy', 'items' keys
         items: Dict of all items
-        store_names: Store ID -> name mapping
+        item_stores: Item ID -> store name mapping (_resolve_item_stores)
 
     Returns:
         Product dict in frontend format, or None if invalid
@@ -44,36 +58,44 @@ def generate_product(match: dict, items: dict, store_names: dict) -> dict | None
     if not match.get("items"):
         return None
 
-    # Get items in this match group
+    # Get items in this match group (keeping ids for store lookups)
     match_items = []
     for item_id in match["items"]:
         item = items.get(item_id)
         if item:
-            match_items.append(item)
+            match_items.append((item_id, item))
 
     if not match_items:
         return None
 
+    # Bail out before building anything when no item has a usable price;
+    # the product would be dropped at the lowest-price step anyway
+    if not any(
+        item.get("price") is not None and item["price"] > 0
+        for _, item in match_items
+    ):
+        return None
+
     # Use first item as canonical source
-    first_item = match_items[0]
+    first_item = match_items[0][1]
 
     product = {
         "id": match["id"],
         "title": first_item["title"],
         "image": first_item.get("image"),
         "category": first_item.get("category", "Uncategorized"),
-        "tags": list(first_item.get("tags", []))[:MAX_TAGS],
+        "tags": [],  # filled from tag_set after the vendor loop
         "vendors": [],
     }
+    tag_set = set()
 
     # Build vendors list from all items
     # Track vendors we've added and collect all their SKUs
     vendor_entries = {}  # store_name -> vendor dict
     vendor_skus = {}  # store_name -> set of SKUs
 
-    for item in match_items:
-        store_id = item.get("storeId")
-        store_name = store_names.get(store_id, store_id)
+    for item_id, item in match_items:
+        store_name = item_stores[item_id]
 
         # Update product fields if better than current
         if product["image"] is None and item.get("image"):
@@ -82,8 +104,8 @@ def generate_product(match: dict, items: dict, store_names: dict) -> dict | None
         if product["category"] == "Uncategorized" and item.get("category", "Uncategorized") != "Uncategorized":
             product["category"] = item["category"]
 
-        # Merge tags
-        product["tags"] = list(set(product["tags"] + item.get("tags", [])))[:MAX_TAGS]
+        # Merge tags (sliced to MAX_TAGS once, after the loop)
+        tag_set.update(item.get("tags", ()))
 
         # Collect SKU even from duplicate vendor items
         if item.get("sku"):
@@ -106,6 +128,8 @@ def generate_product(match: dict, items: dict, store_names: dict) -> dict | None
 
         vendor_entries[store_name] = vendor
 
+    product["tags"] = list(tag_set)[:MAX_TAGS]
+
     # Add all collected SKUs to each vendor entry
     for store_name, vendor in vendor_entries.items():
         skus = vendor_skus.get(store_name, set())
@@ -124,15 +148,25 @@ def generate_product(match: dict, items: dict, store_names: dict) -> dict | None
     # Sort vendors: in-stock first, then by price
     product["vendors"].sort(key=lambda v: (not v["inStock"], v["price"]))
 
-    # Calculate lowest price (prefer in-stock)
-    all_prices = [v["price"] for v in product["vendors"] if v["price"] is not None and v["price"] > 0]
-    in_stock_prices = [v["price"] for v in product["vendors"] if v["inStock"] and v["price"] is not None and v["price"] > 0]
-
-    if not all_prices:
+    # Calculate lowest price (prefer in-stock) and stock flag in one pass
+    min_any = None
+    min_in_stock = None
+    any_in_stock = False
+    for vendor in product["vendors"]:
+        price = vendor["price"]
+        if vendor["inStock"]:
+            any_in_stock = True
+        if price is not None and price > 0:
+            if min_any is None or price < min_any:
+                min_any = price
+            if vendor["inStock"] and (min_in_stock is None or price < min_in_stock):
+                min_in_stock = price
+
+    if min_any is None:
         return None
 
-    product["lowestPrice"] = min(in_stock_prices) if in_stock_prices else min(all_prices)
-    product["inStock"] = any(v["inStock"] for v in product["vendors"])
+    product["lowestPrice"] = min_in_stock if min_in_stock is not None else min_any
+    product["inStock"] = any_in_stock
 
     return product
 
@@ -148,9 +182,11 @@ def generate_products(items: dict, matches: list, store_names: dict) -> list:
     Returns:
         List of products in frontend format
     """
+    item_stores = _resolve_item_stores(items, store_names)
+
     products = []
     for match in matches:
-        product = generate_product(match, items, store_names)
+        product = generate_product(match, items, item_stores)
         if product:
             products.append(product)
 
@@ -176,6 +212,7 @@ def generate_tracker_data(item_history: dict, matches: list, items: dict, store_
         Tracker data dict in frontend format
     """
     history_entries = item_history.get("history", {})
+    item_stores = _resolve_item_stores(items, store_names)
 
     output = {
         "lastUpdated": item_history.get("lastUpdated"),
@@ -195,23 +232,24 @@ def generate_tracker_data(item_history: dict, matches: list, items: dict, store_
             if not item:
                 continue
 
-            store_id = item.get("storeId")
-            store_name = store_names.get(store_id, store_id)
+            store_name = item_stores[item_id]
             item_entries = history_entries.get(item_id, [])
 
             if item_entries:
                 # Convert to vendor history format with prev field for price changes
                 # and stockPrev field for stock transitions
                 vendor_history = []
+                append = vendor_history.append  # bound once for the loop
                 prev_price = None
                 prev_stock = None
                 for entry in item_entries:
-                    vendor_entry = {"t": entry["t"], "p": entry["p"]}
+                    price = entry["p"]
+                    vendor_entry = {"t": entry["t"], "p": price}
                     # Include regular price if present (for detecting fake sales)
                     if "rp" in entry:
                         vendor_entry["rp"] = entry["rp"]
                     # Add prev field if price changed
-                    if prev_price is not None and abs(entry["p"] - prev_price) > 0.005:
+                    if prev_price is not None and abs(price - prev_price) > 0.005:
                         vendor_entry["prev"] = prev_price
                     # Track stock transitions
                     current_stock = entry.get("s")
@@ -220,8 +258,8 @@ def generate_tracker_data(item_history: dict, matches: list, items: dict, store_
                         if prev_stock is not None and current_stock != prev_stock:
                             vendor_entry["stockPrev"] = prev_stock
                         prev_stock = current_stock
-                    vendor_history.append(vendor_entry)
-                    prev_price = entry["p"]
+                    append(vendor_entry)
+                    prev_price = price
 
                 product_history["vendors"][store_name] = vendor_history
 
@@ -237,34 +275,31 @@ def generate_tracker_data(item_history: dict, matches: list, items: dict, store_
                         "v": vendor_name,
                     })
 
-            # Sort by time and build lowest history
-            all_entries.sort(key=lambda e: e["t"])
-
-            # For each unique timestamp, find the lowest price
-            timestamps = sorted(set(e["t"] for e in all_entries))
+            # Sort by time once, then take each timestamp's entries as a
+            # group instead of rescanning all entries per unique timestamp
+            all_entries.sort(key=itemgetter("t"))
             latest_prices = {}  # vendor -> latest price at each point
             prev_lowest = None  # Track previous lowest price
 
-            for ts in timestamps:
+            for ts, group in groupby(all_entries, key=itemgetter("t")):
                 # Update latest prices with this timestamp's entries
-                for entry in all_entries:
-                    if entry["t"] == ts:
-                        latest_prices[entry["v"]] = entry["p"]
-
-                # Find lowest among current latest prices
-                if latest_prices:
-                    lowest = min(latest_prices.values())
-                    lowest_vendor = min(latest_prices.items(), key=lambda x: x[1])[0]
-                    entry = {
-                        "t": ts,
-                        "p": lowest,
-                        "v": lowest_vendor,
-                    }
-                    # Add prev field if price changed
-                    if prev_lowest is not None and abs(lowest - prev_lowest) >= 0.01:
-                        entry["prev"] = prev_lowest
-                    product_history["lowest"].append(entry)
-                    prev_lowest = lowest
+                for entry in group:
+                    latest_prices[entry["v"]] = entry["p"]
+
+                # Find lowest among current latest prices (one scan: the
+                # winning vendor's price is the lowest price)
+                lowest_vendor = min(latest_prices, key=latest_prices.__getitem__)
+                lowest = latest_prices[lowest_vendor]
+                entry = {
+                    "t": ts,
+                    "p": lowest,
+                    "v": lowest_vendor,
+                }
+                # Add prev field if price changed
+                if prev_lowest is not None and abs(lowest - prev_lowest) >= 0.01:
+                    entry["prev"] = prev_lowest
+                product_history["lowest"].append(entry)
+                prev_lowest = lowest
 
             output["history"][match_id] = product_history
 
@@ -281,19 +316,38 @@ def save_products(products: list, last_updated: str, store_count: int) -> None:
     }
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
-    with open(PRODUCTS_FILE, "w") as f:
+    # Large buffer: indented json.dump writes in many small pieces
+    with open(PRODUCTS_FILE, "w", buffering=1024 * 1024) as f:
         json.dump(output, f, indent=2)
 
     logger.info(f"Saved {len(products)} products to {PRODUCTS_FILE}")
 
 
 def save_tracker_data(tracker_data: dict) -> None:
-    """Save tracker-data.json."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    with open(TRACKER_DATA_FILE, "w") as f:
-        json.dump(tracker_data, f, separators=(",", ":"))
+    """Save tracker-data.json.
 
-    product_count = len(tracker_data.get("history", {}))
+    The serialized history grows with products x vendors x timestamps, so
+    write through a 1 MB buffer and emit one product's history at a time
+    rather than materializing the whole JSON text in memory first.
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    history = tracker_data.get("history", {})
+    with open(TRACKER_DATA_FILE, "w", buffering=1024 * 1024) as f:
+        f.write('{"lastUpdated":')
+        json.dump(tracker_data.get("lastUpdated"), f)
+        f.write(',"history":{')
+        first = True
+        for match_id, product_history in history.items():
+            if first:
+                first = False
+            else:
+                f.write(",")
+            json.dump(match_id, f)
+            f.write(":")
+            json.dump(product_history, f, separators=(",", ":"))
+        f.write("}}")
+
+    product_count = len(history)
     logger.info(f"Saved tracker data for {product_count} products to {TRACKER_DATA_FILE}")
 
 
@@ -61,7 +61,8 @@ def save_history(history_data: dict) -> None:
 
     ITEM_HISTORY_FILE.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(ITEM_HISTORY_FILE, "w") as f:
+    # Large buffer: json.dump issues many small writes on a big history
+    with open(ITEM_HISTORY_FILE, "w", buffering=1024 * 1024) as f:
         json.dump(history_data, f, separators=(",", ":"))
 
     # Count total entries
@@ -15,6 +15,13 @@ from config import FUZZY_THRESHOLD
 
 log = logging.getLogger(__name__)
 
+# Compiled once: these run per item in the matching hot path, and going
+# through re.search/re.sub pays the pattern-cache lookup every call
+_LETTER_RE = re.compile(r"[A-Za-z]")
+_PAREN_SUFFIX_RE = re.compile(r"\s+\([^)]+\)\s*$")
+_PUNCT_RE = re.compile(r"[^\w\s-]")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 def is_valid_sku(sku: str | None) -> bool:
     """Check if SKU is valid for matching.
@@ -35,7 +42,7 @@ def is_valid_sku(sku: str | None) -> bool:
         return False
 
     # Must contain at least one letter
-    if not re.search(r"[A-Za-z]", sku):
+    if not _LETTER_RE.search(sku):
         return False
 
     return True
@@ -55,7 +62,7 @@ def normalize_sku(sku: str) -> str:
     """
     sku = sku.upper().strip()
     # Remove parenthetical suffix only if preceded by space
-    sku = re.sub(r"\s+\([^)]+\)\s*$", "", sku)
+    sku = _PAREN_SUFFIX_RE.sub("", sku)
     return sku
 
 
@@ -67,9 +74,9 @@ def normalize_title(title: str) -> str:
     """
     title = title.lower().strip()
     # Remove punctuation except hyphens in product codes
-    title = re.sub(r"[^\w\s-]", "", title)
+    title = _PUNCT_RE.sub("", title)
     # Normalize whitespace
-    title = re.sub(r"\s+", " ", title)
+    title = _WHITESPACE_RE.sub(" ", title)
     return title.strip()
 
 
@@ -116,7 +123,9 @@ def match_items(items: dict) -> list[dict]:
     # SKU -> match group (for SKU-based matching)
     sku_groups: dict[str, dict] = {}
 
-    # normalized_title -> match group (for title-based matching)
+    # normalized_title -> match group (for title-based matching). Same-store
+    # skips can create several groups with one normalized title; the latest
+    # one owns the key, and fuzzy hits resolve through it.
     title_groups: dict[str, dict] = {}
 
     # Track which stores are in each group (group_id -> set of store_ids)
@@ -125,25 +134,41 @@ def match_items(items: dict) -> list[dict]:
     # Track all matches for efficient lookup
     all_matches: list[dict] = []
 
-    # Keys for fuzzy matching (normalized titles)
+    # Keys for fuzzy matching: token-sorted forms for scoring, aligned
+    # with the normalized titles they came from
     title_keys: list[str] = []
+    normalized_keys: list[str] = []
 
     stats = {"sku_matches": 0, "fuzzy_matches": 0, "new_groups": 0, "same_store_skipped": 0}
 
-    # Sort items for deterministic matching
-    sorted_items = sorted(items.items(), key=lambda x: (normalize_title(x[1]["title"]), x[0]))
-
-    for item_id, item in sorted_items:
+    # Derive each item's matching fields once up front; the loop below
+    # used to recompute SKU validity and normalization up to four times
+    # per item and the normalized title twice. Plain tuple sort gives the
+    # same deterministic (normalized title, item_id) order as before.
+    # The token-sorted form is precomputed so the fuzzy pass can score
+    # with plain fuzz.ratio instead of re-tokenizing both sides in
+    # token_sort_ratio on every comparison.
+    prepped = []
+    for item_id, item in items.items():
         sku = item.get("sku")
-        title = item.get("title", "")
-        store_id = item.get("storeId")
-        normalized = normalize_title(title)
-
+        valid_sku = is_valid_sku(sku)
+        normalized = normalize_title(item.get("title", ""))
+        prepped.append((
+            normalized,
+            item_id,
+            item.get("title", ""),
+            item.get("storeId"),
+            valid_sku,
+            normalize_sku(sku) if valid_sku else None,
+            " ".join(sorted(normalized.split())),
+        ))
+    prepped.sort()
+
+    for normalized, item_id, title, store_id, valid_sku, sku_normalized, token_sorted in prepped:
         matched = False
 
         # 1. Try SKU match first (if item has valid SKU)
-        if is_valid_sku(sku):
-            sku_normalized = normalize_sku(sku)
+        if valid_sku:
             if sku_normalized in sku_groups:
                 match_group = sku_groups[sku_normalized]
                 # Only match if from a different store (cross-store matching only)
@@ -159,11 +184,11 @@ def match_items(items: dict) -> list[dict]:
         # Use token_sort_ratio to ignore word order differences
         if not matched and title_keys:
             result = process.extractOne(
-                normalized, title_keys, scorer=fuzz.token_sort_ratio, score_cutoff=FUZZY_THRESHOLD
+                token_sorted, title_keys, scorer=fuzz.ratio,
+                processor=None, score_cutoff=FUZZY_THRESHOLD,
             )
             if result:
-                match_key = result[0]
-                match_group = title_groups[match_key]
+                match_group = title_groups[normalized_keys[result[2]]]
 
                 # Only match if from a different store (cross-store matching only)
                 old_group_id = match_group["id"]
@@ -172,8 +197,7 @@ def match_items(items: dict) -> list[dict]:
                     group_stores[old_group_id].add(store_id)
 
                     # Also register this item's SKU for future matches
-                    if is_valid_sku(sku):
-                        sku_normalized = normalize_sku(sku)
+                    if valid_sku:
                         if sku_normalized not in sku_groups:
                             sku_groups[sku_normalized] = match_group
                             # Upgrade match type to SKU if it was title-based
@@ -191,8 +215,7 @@ def match_items(items: dict) -> list[dict]:
 
         # 3. Create new group if no match found
         if not matched:
-            if is_valid_sku(sku):
-                sku_normalized = normalize_sku(sku)
+            if valid_sku:
                 match_id = f"sku-{sku_normalized}"
                 match_type = "sku"
             else:
@@ -217,11 +240,12 @@ def match_items(items: dict) -> list[dict]:
             group_stores[match_id] = {store_id}
 
             # Register in appropriate lookup
-            if is_valid_sku(sku):
+            if valid_sku:
                 sku_groups[sku_normalized] = new_group
 
             title_groups[normalized] = new_group
-            title_keys.append(normalized)
+            title_keys.append(token_sorted)
+            normalized_keys.append(normalized)
 
             stats["new_groups"] += 1
 
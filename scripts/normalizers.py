@@ -6,7 +6,7 @@ Consolidates normalization logic that was duplicated across platforms.
 import html
 import re
 from abc import ABC, abstractmethod
-from categories import get_best_category
+from categories import get_best_category, ingest_tags
 
 # SEO spam patterns to strip from titles
 TITLE_CLEANUP_PATTERNS = [
@@ -137,7 +137,7 @@ class ProductNormalizer(ABC):
             title = self.get_title(product)
             tags = self.get_tags(product)
             raw_category = self.get_raw_category(product)
-            category = get_best_category(raw_category, title, tags)
+            category = get_best_category(raw_category, title, ingest_tags(tags))
 
             return {
                 "id": f"{self.store_id_prefix}-{self.get_id(product)}",
@@ -164,7 +164,7 @@ class ProductNormalizer(ABC):
         base_title = self.get_title(product)
         tags = self.get_tags(product)
         raw_category = self.get_raw_category(product)
-        category = get_best_category(raw_category, base_title, tags)
+        category = get_best_category(raw_category, base_title, ingest_tags(tags))
 
         for variant in self.get_variants(product):
             try:
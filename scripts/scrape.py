@@ -158,15 +158,16 @@ def filter_and_normalize(
     filtered_products = []
 
     for product in raw_products:
-        if validator.is_valid(product):
+        # One-pass validation that also reports why a product was filtered
+        reason = validator.validate(product)
+        if reason is None:
             # Use normalize_all to get variant-level items
             normalized_items = normalizer.normalize_all(product)
             items.extend(normalized_items)
         else:
             filtered_count += 1
-            # Capture why this product was filtered
-            reason = validator.get_exclusion_reason(product)
-            if reason:
+            # Price failures carry no keyword and aren't itemized, as before
+            if reason["keyword"]:
                 filtered_products.append({
                     "title": reason["title"],
                     "reason": reason["type"],
@@ -6,9 +6,6 @@ Consolidates validation logic that was duplicated across platforms.
 from abc import ABC, abstractmethod
 from config import MIN_PRICE
 from filters import (
-    is_excluded_by_title,
-    is_excluded_by_tags,
-    is_excluded_by_category,
     get_title_exclusion_match,
     get_tag_exclusion_match,
     get_category_exclusion_match,
@@ -40,30 +37,30 @@ class ProductValidator(ABC):
 
     def is_valid(self, product: dict) -> bool:
         """Check if product passes all validation rules."""
-        # Check price
+        return self.validate(product) is None
+
+    def validate(self, product: dict) -> dict | None:
+        """Run all validation rules in one pass.
+
+        Returns None for a valid product, otherwise the exclusion reason
+        dict from get_exclusion_reason. Price failures return a reason of
+        type "price" with no keyword. Extracting and scanning each field
+        once here avoids the second scan is_valid + get_exclusion_reason
+        used to cost for every excluded product.
+        """
         try:
             price = self.get_price(product)
-            if price < MIN_PRICE:
-                return False
         except (ValueError, TypeError):
-            return False
-
-        # Check title
-        title = self.get_title(product)
-        if is_excluded_by_title(title):
-            return False
-
-        # Check categories
-        for category in self.get_categories(product):
-            if is_excluded_by_category(category):
-                return False
-
-        # Check tags (convert to tuple for cache hashability in filter)
-        tags = tuple(self.get_tags(product))
-        if is_excluded_by_tags(tags):
-            return False
+            price = None
+        if price is None or price < MIN_PRICE:
+            return {
+                "type": "price",
+                "keyword": None,
+                "category": None,
+                "title": self.get_title(product),
+            }
 
-        return True
+        return self.get_exclusion_reason(product)
 
     def get_exclusion_reason(self, product: dict) -> dict | None:
         """Get the reason why a product was excluded.